@@ -0,0 +1,116 @@
+"""
+Запросов в секунду на GET /api/calculations/{uuid} при разных режимах соединений с БД:
+  fresh       — DB_CONN_MAX_AGE=0, новое соединение на каждый запрос
+  persistent  — DB_CONN_MAX_AGE=600 + CONN_HEALTH_CHECKS
+  pool        — DB_POOL=True (psycopg_pool)
+
+Нужен доступный PostgreSQL (DATABASE_URL или DB_*) с применёнными миграциями.
+Запуск: python benchmarks/bench_db_pooling.py [--seconds 10] [--concurrency 8]
+"""
+import argparse
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+import urllib.request
+from pathlib import Path
+
+import django
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'nihss.settings')
+django.setup()
+
+from rest_framework_simplejwt.tokens import RefreshToken  # noqa: E402
+
+from calculator.models import NIHSSCalculation, User  # noqa: E402
+from calculator.services import NIHSSCalculator  # noqa: E402
+
+MODES = {
+    'fresh': {'DB_CONN_MAX_AGE': '0', 'DB_POOL': 'False'},
+    'persistent': {'DB_CONN_MAX_AGE': '600', 'DB_POOL': 'False'},
+    'pool': {'DB_POOL': 'True'},
+}
+
+
+def prepare():
+    user, _ = User.objects.get_or_create(email='bench-pooling@example.com', defaults={'full_name': 'Bench'})
+    scores = {item: 1 for item in NIHSSCalculator.SCORE_ITEMS}
+    total, severity, interpretation = NIHSSCalculator.calculate(scores)
+    calculation = NIHSSCalculation.objects.create(
+        user=user, patient_age=70, total_score=total, severity=severity,
+        interpretation=interpretation, **scores,
+    )
+    return str(RefreshToken.for_user(user).access_token), calculation
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def wait_ready(port, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(f'http://127.0.0.1:{port}/healthz', timeout=1):
+                return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError('gunicorn did not start')
+
+
+def hammer(url, token, seconds, concurrency):
+    counts = [0] * concurrency
+    deadline = time.monotonic() + seconds
+
+    def worker(i):
+        request = urllib.request.Request(url, headers={'Authorization': f'Bearer {token}'})
+        while time.monotonic() < deadline:
+            with urllib.request.urlopen(request) as resp:
+                resp.read()
+            counts[i] += 1
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(concurrency)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return sum(counts) / seconds
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--seconds', type=int, default=10)
+    parser.add_argument('--concurrency', type=int, default=8)
+    args = parser.parse_args()
+
+    token, calculation = prepare()
+    try:
+        for mode, env_overrides in MODES.items():
+            port = free_port()
+            env = {**os.environ, **env_overrides, 'PORT': str(port), 'GUNICORN_LOG_LEVEL': 'warning'}
+            proc = subprocess.Popen(
+                [sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py', '--access-logfile', os.devnull,
+                 'nihss.wsgi:application'],
+                cwd=BACKEND_DIR, env=env,
+            )
+            try:
+                wait_ready(port)
+                url = f'http://127.0.0.1:{port}/api/calculations/{calculation.pk}'
+                hammer(url, token, 1, args.concurrency)  # прогрев
+                rps = hammer(url, token, args.seconds, args.concurrency)
+                print(f'{mode:<12}{rps:>10.0f} req/s')
+            finally:
+                proc.terminate()
+                proc.wait()
+    finally:
+        calculation.delete()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+"""
+Пропускная способность генерации заключений: по одной оценке на запрос
+против пакетных запросов NIHSSGigaChatService.generate_interpretations().
+Вместо GigaChat используется заглушка с фиксированной задержкой на запрос
+и временем генерации, пропорциональным числу заключений.
+
+Запуск: python benchmarks/bench_gigachat_batch.py [--count 40] [--latency 0.4]
+"""
+import argparse
+import json
+import os
+import random
+import re
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import django
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'nihss.settings')
+django.setup()
+
+from calculator.gigachat_service import NIHSSGigaChatService  # noqa: E402
+from calculator.services import NIHSSCalculator  # noqa: E402
+
+
+class StubClient:
+    """Отвечает как GigaChat: текст на одиночный запрос, JSON на пакетный"""
+
+    def __init__(self, latency, per_item, drop_every=0):
+        self.latency = latency
+        self.per_item = per_item
+        self.drop_every = drop_every
+        self.calls = 0
+
+    def chat(self, prompt):
+        self.calls += 1
+        numbers = [int(n) for n in re.findall(r'^### Оценка (\d+)$', prompt, flags=re.MULTILINE)]
+        time.sleep(self.latency + self.per_item * max(len(numbers), 1))
+        if numbers:
+            content = json.dumps({
+                str(n): f'Заключение по оценке {n}.'
+                for n in numbers
+                if not (self.drop_every and n % self.drop_every == 0)
+            }, ensure_ascii=False)
+        else:
+            content = 'Заключение по оценке.'
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+def make_assessments(count):
+    rng = random.Random(0)
+    assessments = []
+    for _ in range(count):
+        scores = {item: rng.randint(0, max_v) for item, max_v in NIHSSCalculator.MAX_SCORES.items()}
+        total, severity, _ = NIHSSCalculator.calculate(scores)
+        assessments.append({
+            'scores': scores, 'total_score': total, 'severity': severity,
+            'patient_age': rng.randint(30, 95), 'patient_notes': '',
+        })
+    return assessments
+
+
+def run(assessments, batch_size, client):
+    service = NIHSSGigaChatService()
+    service.credentials = 'stub'
+    service.client = client
+    started = time.perf_counter()
+    if batch_size == 1:
+        results = [(service.generate_interpretation(**item), False) for item in assessments]
+    else:
+        results = service.generate_interpretations(assessments, batch_size=batch_size)
+    elapsed = time.perf_counter() - started
+    assert len(results) == len(assessments)
+    assert all(text and not is_fallback for text, is_fallback in results)
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--count', type=int, default=40)
+    parser.add_argument('--latency', type=float, default=0.4, help='Накладные расходы на запрос, с')
+    parser.add_argument('--per-item', type=float, default=0.05, help='Генерация одного заключения, с')
+    args = parser.parse_args()
+
+    assessments = make_assessments(args.count)
+    print(f'{"режим":<22}{"запросов":>10}{"оценок/с":>12}')
+    for label, batch_size, drop_every in (
+        ('по одной', 1, 0),
+        ('пакет 5', 5, 0),
+        ('пакет 10', 10, 0),
+        ('пакет 10, пропуски', 10, 4),
+    ):
+        client = StubClient(args.latency, args.per_item, drop_every)
+        elapsed = run(assessments, batch_size, client)
+        print(f'{label:<22}{client.calls:>10}{args.count / elapsed:>12.2f}')
+
+
+if __name__ == '__main__':
+    main()
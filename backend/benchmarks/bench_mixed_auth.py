@@ -0,0 +1,154 @@
+"""
+Смешанная нагрузка: непрерывные логины (Argon2) и чтение расчётов.
+Сравнивает хеширование в потоке запроса (PASSWORD_HASH_WORKERS=0, как раньше)
+и в отдельном пуле процессов: задержку GET /api/calculations/{uuid} и число
+обработанных логинов.
+
+Запуск: python benchmarks/bench_mixed_auth.py [--seconds 10] [--logins 6] [--readers 4]
+"""
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+import django
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'nihss.settings')
+django.setup()
+
+from rest_framework_simplejwt.tokens import RefreshToken  # noqa: E402
+
+from calculator.models import NIHSSCalculation, User  # noqa: E402
+from calculator.services import NIHSSCalculator  # noqa: E402
+
+EMAIL = 'bench-auth@example.com'
+PASSWORD = 'bench-Password-123'
+
+MODES = {
+    'inline (до)': {'PASSWORD_HASH_WORKERS': '0'},
+    'пул процессов': {'PASSWORD_HASH_WORKERS': '1', 'PASSWORD_HASH_QUEUE_LIMIT': '4'},
+}
+
+
+def prepare():
+    User.objects.filter(email=EMAIL).delete()
+    user = User.objects.create_user(EMAIL, 'Bench', PASSWORD)
+    scores = {item: 1 for item in NIHSSCalculator.SCORE_ITEMS}
+    total, severity, interpretation = NIHSSCalculator.calculate(scores)
+    calculation = NIHSSCalculation.objects.create(
+        user=user, patient_age=70, total_score=total, severity=severity,
+        interpretation=interpretation, **scores,
+    )
+    return user, str(RefreshToken.for_user(user).access_token), calculation
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def wait_ready(port, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(f'http://127.0.0.1:{port}/healthz', timeout=1):
+                return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError('gunicorn did not start')
+
+
+def load(port, token, calc_id, seconds, logins, readers):
+    deadline = time.monotonic() + seconds
+    latencies = []
+    login_status = {}
+    lock = threading.Lock()
+    body = json.dumps({'email': EMAIL, 'password': PASSWORD}).encode()
+
+    def login_loop():
+        while time.monotonic() < deadline:
+            request = urllib.request.Request(
+                f'http://127.0.0.1:{port}/api/auth/login', data=body,
+                headers={'Content-Type': 'application/json'},
+            )
+            try:
+                with urllib.request.urlopen(request) as resp:
+                    code = resp.status
+            except urllib.error.HTTPError as e:
+                code = e.code
+            with lock:
+                login_status[code] = login_status.get(code, 0) + 1
+
+    def read_loop():
+        request = urllib.request.Request(
+            f'http://127.0.0.1:{port}/api/calculations/{calc_id}',
+            headers={'Authorization': f'Bearer {token}'},
+        )
+        while time.monotonic() < deadline:
+            started = time.perf_counter()
+            with urllib.request.urlopen(request) as resp:
+                resp.read()
+            with lock:
+                latencies.append(time.perf_counter() - started)
+
+    threads = [threading.Thread(target=login_loop) for _ in range(logins)]
+    threads += [threading.Thread(target=read_loop) for _ in range(readers)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return latencies, login_status
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--seconds', type=int, default=10)
+    parser.add_argument('--logins', type=int, default=6, help='Параллельных клиентов входа')
+    parser.add_argument('--readers', type=int, default=4, help='Параллельных клиентов чтения')
+    args = parser.parse_args()
+
+    user, token, calculation = prepare()
+    try:
+        for mode, env_overrides in MODES.items():
+            port = free_port()
+            env = {
+                **os.environ, **env_overrides, 'PORT': str(port),
+                'GUNICORN_WORKERS': '1', 'GUNICORN_THREADS': '8', 'GUNICORN_LOG_LEVEL': 'warning',
+                'THROTTLE_LOGIN_IP': '100000/min', 'THROTTLE_LOGIN_ACCOUNT': '100000/min',
+            }
+            proc = subprocess.Popen(
+                [sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py', '--access-logfile', os.devnull,
+                 'nihss.wsgi:application'],
+                cwd=BACKEND_DIR, env=env,
+            )
+            try:
+                wait_ready(port)
+                latencies, login_status = load(port, token, calculation.pk, args.seconds, args.logins, args.readers)
+            finally:
+                proc.terminate()
+                proc.wait()
+
+            latencies.sort()
+            p95 = latencies[int(len(latencies) * 0.95)] * 1000
+            print(
+                f'{mode:<16} чтение: {len(latencies) / args.seconds:7.1f} req/s, '
+                f'p50 {statistics.median(latencies) * 1000:6.1f} мс, p95 {p95:6.1f} мс; '
+                f'логины: {login_status}'
+            )
+    finally:
+        user.delete()
+
+
+if __name__ == '__main__':
+    main()
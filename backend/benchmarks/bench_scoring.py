@@ -0,0 +1,79 @@
+"""
+Микробенчмарк: CPU на расчёт одной оценки при создании записи.
+
+legacy — прежний путь: цикл проверки по MAX_SCORES в сериализаторе, затем
+NIHSSCalculator.calculate() с повторным приведением, клиппингом и сборкой
+словарей рекомендаций при каждом вызове.
+fast   — NIHSSCalculator.evaluate() + interpret() по предвычисленным таблицам.
+
+Запуск: python benchmarks/bench_scoring.py
+"""
+import random
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from calculator.services import NIHSSCalculator  # noqa: E402
+
+
+def legacy_interpretation(total, severity, scores):
+    label = NIHSSCalculator.SEVERITY_LABELS[severity]
+    lines = [f'Суммарный балл NIHSS: {total}/42 — {label}.']
+    consciousness = int(scores.get('loc', 0))
+    if consciousness > 0:
+        levels = {1: 'нарушено (сомнолентность)', 2: 'значительно нарушено (сопор)', 3: 'кома/ареактивность'}
+        lines.append(f'Уровень сознания: {levels.get(consciousness, "нарушено")}.')
+    language = int(scores.get('best_language', 0))
+    if language > 0:
+        lang_map = {1: 'лёгкая или умеренная афазия', 2: 'тяжёлая афазия', 3: 'мутизм/глобальная афазия'}
+        lines.append(f'Речь: {lang_map.get(language, "нарушена")}.')
+    motor_total = sum(int(scores.get(k, 0)) for k in (
+        'motor_arm_left', 'motor_arm_right', 'motor_leg_left', 'motor_leg_right'))
+    if motor_total > 0:
+        lines.append(f'Двигательный дефицит: суммарно {motor_total}/16 баллов.')
+    visual = int(scores.get('visual', 0))
+    if visual > 0:
+        vis_map = {1: 'частичная гемианопия', 2: 'полная гемианопия', 3: 'двусторонняя слепота'}
+        lines.append(f'Нарушения зрения: {vis_map.get(visual, "выявлены")}.')
+    recommendations = dict(NIHSSCalculator.RECOMMENDATIONS)
+    lines.append(recommendations.get(severity, ''))
+    return ' '.join(lines)
+
+
+def legacy(data):
+    for item, max_v in NIHSSCalculator.MAX_SCORES.items():
+        if item in data and not (0 <= data[item] <= max_v):
+            raise ValueError(item)
+    scores = {k: data.get(k, 0) for k in NIHSSCalculator.SCORE_ITEMS}
+    total = 0
+    for item in NIHSSCalculator.SCORE_ITEMS:
+        value = int(scores.get(item, 0))
+        total += max(0, min(value, NIHSSCalculator.MAX_SCORES[item]))
+    severity = NIHSSCalculator._classify(total)
+    return total, severity, legacy_interpretation(total, severity, scores)
+
+
+def fast(data):
+    values, total, severity = NIHSSCalculator.evaluate(data)
+    return total, severity, NIHSSCalculator.interpret(values, total, severity)
+
+
+def main():
+    rng = random.Random(0)
+    payloads = [
+        {item: rng.randint(0, max_v) for item, max_v in NIHSSCalculator.MAX_SCORES.items()}
+        for _ in range(1000)
+    ]
+    for data in payloads:
+        assert legacy(data) == fast(data)
+
+    for name, func in (('legacy', legacy), ('fast', fast)):
+        runs = timeit.repeat(lambda: [func(d) for d in payloads], number=20, repeat=5)
+        per_call = min(runs) / (20 * len(payloads)) * 1e6
+        print(f'{name:>6}: {per_call:.2f} мкс на оценку')
+
+
+if __name__ == '__main__':
+    main()
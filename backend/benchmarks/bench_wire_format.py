@@ -0,0 +1,67 @@
+"""
+Байты на проводе и время кодирования страницы истории из 100 оценок
+в JSON и MessagePack, без сжатия и со сжатием gzip/brotli.
+
+Запуск: python benchmarks/bench_wire_format.py
+"""
+import gzip
+import os
+import random
+import sys
+import timeit
+import uuid
+from pathlib import Path
+
+import django
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'nihss.settings')
+django.setup()
+
+from django.utils import timezone  # noqa: E402
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+
+from calculator.models import NIHSSCalculation  # noqa: E402
+from calculator.renderers import MessagePackRenderer  # noqa: E402
+from calculator.serializers import NIHSSCalculationSerializer  # noqa: E402
+from calculator.services import NIHSSCalculator  # noqa: E402
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+def build_page(rows=100):
+    rng = random.Random(0)
+    calculations = []
+    for _ in range(rows):
+        scores = {item: rng.randint(0, max_v) for item, max_v in NIHSSCalculator.MAX_SCORES.items()}
+        total, severity, interpretation = NIHSSCalculator.calculate(scores)
+        calculations.append(NIHSSCalculation(
+            id=uuid.uuid4(), patient_age=rng.randint(30, 95), total_score=total,
+            severity=severity, interpretation=interpretation, created_at=timezone.now(), **scores,
+        ))
+    return {
+        'count': rows, 'next': None, 'previous': None,
+        'results': NIHSSCalculationSerializer(calculations, many=True).data,
+    }
+
+
+def main():
+    page = build_page()
+    encoders = {'json': JSONRenderer().render, 'msgpack': MessagePackRenderer().render}
+    compressors = {'none': lambda b: b, 'gzip': lambda b: gzip.compress(b, compresslevel=6)}
+    if brotli is not None:
+        compressors['br'] = lambda b: brotli.compress(b, quality=5)
+
+    print(f'{"формат":<10}{"сжатие":<8}{"байт":>10}{"мс":>10}')
+    for enc_name, encode in encoders.items():
+        for comp_name, compress in compressors.items():
+            size = len(compress(encode(page)))
+            seconds = min(timeit.repeat(lambda: compress(encode(page)), number=50, repeat=5)) / 50
+            print(f'{enc_name:<10}{comp_name:<8}{size:>10}{seconds * 1000:>10.2f}')
+
+
+if __name__ == '__main__':
+    main()
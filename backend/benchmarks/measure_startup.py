@@ -0,0 +1,78 @@
+"""
+Время холодного старта: импорт WSGI-приложения и запуск gunicorn
+с gunicorn.conf.py до первого успешного ответа /healthz.
+
+Запуск: python benchmarks/measure_startup.py [--runs 5] [--no-preload]
+"""
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+IMPORT_SNIPPET = (
+    'import time; t = time.perf_counter(); '
+    'import nihss.wsgi; from importlib import import_module; '
+    'from django.conf import settings; import_module(settings.ROOT_URLCONF); '
+    'print(time.perf_counter() - t)'
+)
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def measure_import():
+    out = subprocess.run(
+        [sys.executable, '-c', IMPORT_SNIPPET],
+        cwd=BACKEND_DIR, capture_output=True, text=True, check=True,
+    )
+    return float(out.stdout.strip().splitlines()[-1])
+
+
+def measure_gunicorn(preload, timeout=30):
+    port = free_port()
+    env = {**os.environ, 'PORT': str(port), 'GUNICORN_PRELOAD': str(preload)}
+    started = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py', 'nihss.wsgi:application'],
+        cwd=BACKEND_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        while time.perf_counter() - started < timeout:
+            try:
+                with urllib.request.urlopen(f'http://127.0.0.1:{port}/healthz', timeout=1) as resp:
+                    if resp.status == 200:
+                        return time.perf_counter() - started
+            except OSError:
+                time.sleep(0.05)
+        raise RuntimeError('gunicorn did not become healthy in time')
+    finally:
+        proc.terminate()
+        proc.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--no-preload', action='store_true')
+    args = parser.parse_args()
+
+    imports = [measure_import() for _ in range(args.runs)]
+    print(f'импорт WSGI + URLconf: медиана {statistics.median(imports) * 1000:.0f} мс')
+
+    preload = not args.no_preload
+    boots = [measure_gunicorn(preload) for _ in range(args.runs)]
+    print(f'gunicorn (preload={preload}) до /healthz: медиана {statistics.median(boots) * 1000:.0f} мс')
+
+
+if __name__ == '__main__':
+    main()
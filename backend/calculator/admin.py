@@ -1,6 +1,55 @@
+import csv
+import json
+
+from django.conf import settings
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
-from .models import User, NIHSSCalculation
+from django.core.paginator import Paginator
+from django.db import connections
+from django.http import StreamingHttpResponse
+from django.utils.functional import cached_property
+from .models import User, Patient, NIHSSCalculation
+from .services import NIHSSCalculator
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Пагинатор без точного COUNT(*) на больших таблицах PostgreSQL.
+    Для нефильтрованного списка берётся pg_class.reltuples, для отфильтрованного —
+    оценка строк из плана запроса; ниже порога количество считается точно.
+    """
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        connection = connections[queryset.db]
+        if connection.vendor != 'postgresql':
+            return super().count
+
+        threshold = settings.ADMIN_ESTIMATED_COUNT_THRESHOLD
+        estimate = self._estimate(queryset, connection)
+        if estimate is None or estimate < threshold:
+            return super().count
+        return estimate
+
+    @staticmethod
+    def _estimate(queryset, connection):
+        with connection.cursor() as cursor:
+            if not queryset.query.where:
+                cursor.execute(
+                    'SELECT reltuples::bigint FROM pg_class WHERE relname = %s',
+                    [queryset.model._meta.db_table],
+                )
+                row = cursor.fetchone()
+                # reltuples = -1, пока таблица не анализировалась
+                return row[0] if row and row[0] >= 0 else None
+
+            sql, params = queryset.order_by().query.sql_with_params()
+            cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+            plan = cursor.fetchone()[0]
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            return int(plan[0]['Plan']['Plan Rows'])
 
 
 @admin.register(User)
@@ -22,10 +71,51 @@ class UserAdmin(BaseUserAdmin):
     )
 
 
+@admin.register(Patient)
+class PatientAdmin(admin.ModelAdmin):
+    list_display = ('label', 'user', 'created_at')
+    list_select_related = ('user',)
+    search_fields = ('label',)
+    ordering = ('-created_at',)
+    readonly_fields = ('id', 'created_at')
+
+
 @admin.register(NIHSSCalculation)
 class NIHSSCalculationAdmin(admin.ModelAdmin):
     list_display = ('user', 'total_score', 'severity', 'patient_age', 'created_at')
     list_filter = ('severity',)
-    search_fields = ('user__email',)
+    list_select_related = ('user',)
+    # Вместо <select> со всеми пользователями и пациентами — поле для UUID
+    raw_id_fields = ('user', 'patient')
+    search_fields = ('=user__email',)
+    date_hierarchy = 'created_at'
     ordering = ('-created_at',)
-    readonly_fields = ('id', 'total_score', 'severity', 'interpretation', 'created_at')
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    actions = ('export_csv',)
+    readonly_fields = (
+        'id', 'total_score', 'severity', 'total_delta', 'score_deltas', 'interpretation', 'created_at',
+    )
+
+    @admin.action(description='Экспорт выбранных оценок в CSV')
+    def export_csv(self, request, queryset):
+        columns = ('id', 'user__email', 'patient_age', *NIHSSCalculator.SCORE_ITEMS,
+                   'total_score', 'severity', 'created_at')
+        rows = queryset.order_by().values_list(*columns).iterator(chunk_size=2000)
+        writer = csv.writer(_Echo())
+
+        def stream():
+            yield writer.writerow(columns)
+            for row in rows:
+                yield writer.writerow(row)
+
+        response = StreamingHttpResponse(stream(), content_type='text/csv; charset=utf-8')
+        response['Content-Disposition'] = 'attachment; filename="nihss_calculations.csv"'
+        return response
+
+
+class _Echo:
+    """Файлоподобный объект для csv.writer: возвращает строку, а не накапливает её"""
+
+    def write(self, value):
+        return value
@@ -1,4 +1,7 @@
+import json
 import logging
+import threading
+import time
 from django.conf import settings
 
 logger = logging.getLogger(__name__)
@@ -35,7 +38,55 @@ class NIHSSGigaChatService:
 
     def __init__(self):
         self.credentials = getattr(settings, 'GIGACHAT_CREDENTIALS', '')
+        self.timeout = getattr(settings, 'GIGACHAT_TIMEOUT', 30)
         self.client = None
+        # Circuit breaker: after N consecutive errors GigaChat is skipped for cooldown seconds
+        self.failure_threshold = getattr(settings, 'GIGACHAT_BREAKER_THRESHOLD', 3)
+        self.cooldown = getattr(settings, 'GIGACHAT_BREAKER_COOLDOWN', 60)
+        self._failures = 0
+        self._opened_at = None
+        self._half_open = False
+        self._lock = threading.Lock()
+
+    @property
+    def breaker_open(self) -> bool:
+        with self._lock:
+            return self._opened_at is not None and (
+                self._half_open or time.monotonic() - self._opened_at < self.cooldown
+            )
+
+    def _allow_request(self) -> bool:
+        """
+        Whether the caller may call the API. Once the cooldown has passed,
+        exactly one caller is let through as a probe; everyone else keeps
+        getting the fallback until the probe records success or failure.
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if self._half_open or time.monotonic() - self._opened_at < self.cooldown:
+                return False
+            self._half_open = True
+            return True
+
+    def _record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._half_open = False
+
+    def _record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._half_open or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+            self._half_open = False
+
+    def status(self) -> str:
+        """Breaker state for /readyz: disabled, open or closed"""
+        if not self.credentials:
+            return 'disabled'
+        return 'open' if self.breaker_open else 'closed'
 
     def _get_client(self):
         """Lazy initialization of GigaChat client"""
@@ -47,6 +98,7 @@ class NIHSSGigaChatService:
                     scope="GIGACHAT_API_PERS",
                     model="GigaChat",
                     verify_ssl_certs=False,
+                    timeout=self.timeout,
                 )
             except Exception as e:
                 logger.error(f"Failed to initialize GigaChat client: {e}")
@@ -65,12 +117,143 @@ class NIHSSGigaChatService:
         Generate detailed NIHSS interpretation using GigaChat API.
         Falls back to static interpretation if GigaChat is unavailable.
         """
+        content = self.request_interpretation(scores, total_score, severity, patient_age, patient_notes)
+        if content is None:
+            return self._get_fallback_interpretation(scores, total_score, severity)
+        return content
+
+    def request_interpretation(
+        self,
+        scores: dict,
+        total_score: int,
+        severity: str,
+        patient_age: int,
+        patient_notes: str = '',
+    ) -> str | None:
+        """
+        Single-assessment GigaChat call; None if the API is unavailable or failed.
+        For callers that build their own fallback (the create serializer reuses
+        its precomputed score tuple).
+        """
         client = self._get_client()
 
-        if not client:
-            return self._get_fallback_interpretation(scores, total_score, severity)
+        if not client or not self._allow_request():
+            return None
+
+        prompt = f"""Ты — опытный невролог. Пациенту проведена оценка по шкале NIHSS (Шкала инсульта Национального института здоровья).
+
+{self._describe_assessment(scores, total_score, severity, patient_age, patient_notes)}
+
+Напиши краткое (4-6 предложений) клиническое заключение для врача. Укажи:
+1. Что означает данный балл по шкале NIHSS
+2. Какие неврологические домены наиболее поражены
+3. Тактику ведения пациента (госпитализация, реперфузия, мониторинг)
+
+Отвечай на русском языке, профессиональным медицинским языком, без лишних вводных фраз."""
+
+        try:
+            response = client.chat(prompt)
+            content = response.choices[0].message.content.strip()
+        except Exception as e:
+            logger.error(f"GigaChat API error: {e}")
+            self._record_failure()
+            return None
+        self._record_success()
+        return content
+
+    def generate_interpretations(self, assessments: list, batch_size: int = 5) -> list:
+        """
+        Batch variant of generate_interpretation for imports and backfills.
+        assessments — list of dicts with the generate_interpretation arguments.
+        Packs up to batch_size assessments into one prompt and asks for a JSON
+        object keyed by assessment number. Items missing or malformed in the
+        response fall back to the single-assessment call; if the batch call
+        itself fails, the whole batch gets the static interpretation.
+        Returns (text, is_fallback) pairs in input order, so callers that
+        overwrite stored text can skip the static ones.
+        """
+        results = []
+        for start in range(0, len(assessments), batch_size):
+            results.extend(self._generate_batch(assessments[start:start + batch_size]))
+        return results
+
+    def _generate_batch(self, batch: list) -> list:
+        if len(batch) == 1:
+            return [self._single_or_fallback(batch[0])]
+        if not self._get_client() or not self._allow_request():
+            return [self._fallback_for(item) for item in batch]
 
-        # Build score breakdown for affected items
+        sections = "\n\n".join(
+            f"### Оценка {number}\n{self._describe_assessment(**item)}"
+            for number, item in enumerate(batch, start=1)
+        )
+        prompt = f"""Ты — опытный невролог. Ниже {len(batch)} независимых оценок по шкале NIHSS (Шкала инсульта Национального института здоровья), каждая для отдельного пациента.
+
+{sections}
+
+Для каждой оценки напиши краткое (4-6 предложений) клиническое заключение для врача. Укажи:
+1. Что означает данный балл по шкале NIHSS
+2. Какие неврологические домены наиболее поражены
+3. Тактику ведения пациента (госпитализация, реперфузия, мониторинг)
+
+Отвечай на русском языке, профессиональным медицинским языком, без лишних вводных фраз.
+Верни только JSON-объект без пояснений, где ключ — номер оценки, значение — заключение:
+{{"1": "...", "2": "..."}}"""
+
+        try:
+            response = self.client.chat(prompt)
+            content = response.choices[0].message.content
+        except Exception as e:
+            logger.error(f"GigaChat API error: {e}")
+            self._record_failure()
+            return [self._fallback_for(item) for item in batch]
+        self._record_success()
+
+        parsed = self._parse_batch_response(content, len(batch))
+        results = []
+        for number, item in enumerate(batch, start=1):
+            text = parsed.get(number)
+            if text is None:
+                logger.warning(f"GigaChat batch response has no valid section {number}, retrying individually")
+                results.append(self._single_or_fallback(item))
+            else:
+                results.append((text, False))
+        return results
+
+    @staticmethod
+    def _parse_batch_response(content: str, expected: int) -> dict:
+        """Extract {number: text} from the model output; invalid entries are dropped"""
+        text = content.strip()
+        # The model sometimes wraps JSON in ```json fences or adds text around it
+        start, end = text.find('{'), text.rfind('}')
+        if start == -1 or end <= start:
+            return {}
+        try:
+            data = json.loads(text[start:end + 1])
+        except ValueError:
+            return {}
+        if not isinstance(data, dict):
+            return {}
+
+        parsed = {}
+        for key, value in data.items():
+            try:
+                number = int(str(key).strip())
+            except ValueError:
+                continue
+            if 1 <= number <= expected and isinstance(value, str) and value.strip():
+                parsed[number] = value.strip()
+        return parsed
+
+    def _describe_assessment(
+        self,
+        scores: dict,
+        total_score: int,
+        severity: str,
+        patient_age: int,
+        patient_notes: str = '',
+    ) -> str:
+        """Patient data and NIHSS results block shared by single and batch prompts"""
         affected_items = [
             f"- {self.ITEM_DESCRIPTIONS[key]}: {value} балл(а)"
             for key, value in scores.items()
@@ -85,9 +268,7 @@ class NIHSSGigaChatService:
         severity_ru = self.SEVERITY_RU.get(severity, severity)
         notes_section = f"\nПримечания врача: {patient_notes}" if patient_notes.strip() else ""
 
-        prompt = f"""Ты — опытный невролог. Пациенту проведена оценка по шкале NIHSS (Шкала инсульта Национального института здоровья).
-
-Данные пациента:
+        return f"""Данные пациента:
 - Возраст: {patient_age} лет{notes_section}
 
 Результаты NIHSS:
@@ -95,21 +276,16 @@ class NIHSSGigaChatService:
 - Степень тяжести: {severity_ru}
 
 Нарушенные показатели:
-{affected_text}
-
-Напиши краткое (4-6 предложений) клиническое заключение для врача. Укажи:
-1. Что означает данный балл по шкале NIHSS
-2. Какие неврологические домены наиболее поражены
-3. Тактику ведения пациента (госпитализация, реперфузия, мониторинг)
+{affected_text}"""
 
-Отвечай на русском языке, профессиональным медицинским языком, без лишних вводных фраз."""
+    def _single_or_fallback(self, item: dict) -> tuple:
+        content = self.request_interpretation(**item)
+        if content is None:
+            return self._fallback_for(item)
+        return content, False
 
-        try:
-            response = client.chat(prompt)
-            return response.choices[0].message.content.strip()
-        except Exception as e:
-            logger.error(f"GigaChat API error: {e}")
-            return self._get_fallback_interpretation(scores, total_score, severity)
+    def _fallback_for(self, item: dict) -> tuple:
+        return self._get_fallback_interpretation(item['scores'], item['total_score'], item['severity']), True
 
     def _get_fallback_interpretation(self, scores: dict, total_score: int, severity: str) -> str:
         """Static fallback interpretation when GigaChat is unavailable"""
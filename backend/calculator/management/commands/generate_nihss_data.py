@@ -0,0 +1,158 @@
+import csv
+import io
+import random
+import time
+import uuid
+from datetime import timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+
+from calculator.models import NIHSSCalculation, User
+from calculator.services import NIHSSCalculator
+
+COPY_COLUMNS = (
+    'id', 'user_id', 'patient_age', 'patient_notes',
+    *NIHSSCalculator.SCORE_ITEMS,
+    'total_score', 'severity', 'interpretation', 'created_at',
+)
+
+
+class Command(BaseCommand):
+    help = 'Генерирует синтетических пользователей и оценки NIHSS для нагрузочного тестирования'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=100, help='Количество пользователей')
+        parser.add_argument('--calculations', type=int, default=10000, help='Количество оценок')
+        parser.add_argument('--seed', type=int, default=42, help='Seed генератора для воспроизводимости')
+        parser.add_argument('--batch-size', type=int, default=50000, help='Строк в одной вставке')
+        parser.add_argument('--days', type=int, default=365, help='Период, по которому распределяются даты')
+        parser.add_argument(
+            '--method', choices=('auto', 'copy', 'bulk'), default='auto',
+            help='copy — COPY FROM STDIN (только PostgreSQL), bulk — bulk_create',
+        )
+
+    def handle(self, *args, **options):
+        if options['users'] < 1:
+            raise CommandError('--users должно быть не меньше 1')
+        method = options['method']
+        if method == 'auto':
+            method = 'copy' if connection.vendor == 'postgresql' else 'bulk'
+        if method == 'copy' and connection.vendor != 'postgresql':
+            raise CommandError('--method copy доступен только для PostgreSQL')
+        # UUID пользователей и оценок выводятся из seed, повторный запуск дал бы те же ключи
+        if User.objects.filter(email__startswith=f'synthetic-{options["seed"]}-').exists():
+            raise CommandError(
+                f'Данные с --seed {options["seed"]} уже сгенерированы, укажите другой --seed'
+            )
+
+        rng = random.Random(options['seed'])
+        user_ids = self._create_users(rng, options['users'], options['seed'])
+        profiles = self._build_profiles(rng, min(options['calculations'], 20000) or 1)
+
+        insert = self._copy_rows if method == 'copy' else self._bulk_rows
+        total = options['calculations']
+        batch_size = options['batch_size']
+        now = timezone.now()
+        period = options['days'] * 86400
+        started = time.monotonic()
+        done = 0
+
+        while done < total:
+            size = min(batch_size, total - done)
+            rows = [
+                (
+                    uuid.UUID(int=rng.getrandbits(128), version=4),
+                    rng.choice(user_ids),
+                    min(100, max(18, int(rng.gauss(68, 13)))),
+                    rng.choice(profiles),
+                    now - timedelta(seconds=rng.randrange(period)),
+                )
+                for _ in range(size)
+            ]
+            insert(rows)
+            done += size
+            elapsed = time.monotonic() - started
+            self.stdout.write(f'{done}/{total} оценок, {done / elapsed:,.0f} строк/с')
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Создано {len(user_ids)} пользователей и {total} оценок за {time.monotonic() - started:.1f} с ({method})'
+        ))
+
+    def _create_users(self, rng, count, seed):
+        # Один хеш на всех: Argon2 на каждого пользователя занял бы больше, чем вся вставка
+        password = make_password('synthetic-password')
+        users = [
+            User(
+                id=uuid.UUID(int=rng.getrandbits(128), version=4),
+                email=f'synthetic-{seed}-{i}@example.com',
+                full_name=f'Синтетический пользователь {i}',
+                password=password,
+            )
+            for i in range(count)
+        ]
+        User.objects.bulk_create(users, batch_size=5000)
+        # Порядок списка важен: по нему rng.choice выбирает авторов оценок
+        return [user.id for user in users]
+
+    @staticmethod
+    def _build_profiles(rng, count):
+        """
+        Пул профилей (баллы, итог, тяжесть, заключение). Тяжесть каждого пациента
+        задаётся бета-распределением со смещением к малым инсультам, пункты шкалы
+        коррелируют через неё. Заключения повторяются, поэтому кешируются.
+        """
+        interpretations = {}
+        profiles = []
+        for _ in range(count):
+            burden = rng.betavariate(0.8, 3.0)
+            scores = {
+                item: sum(rng.random() < burden for _ in range(max_v))
+                for item, max_v in NIHSSCalculator.MAX_SCORES.items()
+            }
+            total = sum(scores.values())
+            severity = NIHSSCalculator._classify(total)
+            key = (
+                total, scores['loc'], scores['best_language'], scores['visual'],
+                scores['motor_arm_left'] + scores['motor_arm_right']
+                + scores['motor_leg_left'] + scores['motor_leg_right'],
+            )
+            if key not in interpretations:
+                interpretations[key] = NIHSSCalculator._generate_interpretation(total, severity, scores)
+            values = tuple(scores[item] for item in NIHSSCalculator.SCORE_ITEMS)
+            profiles.append((values, total, severity, interpretations[key]))
+        return profiles
+
+    @staticmethod
+    def _copy_rows(rows):
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for calc_id, user_id, age, (values, total, severity, interpretation), created_at in rows:
+            writer.writerow((calc_id, user_id, age, '', *values, total, severity, interpretation, created_at.isoformat()))
+
+        sql = (
+            f'COPY {NIHSSCalculation._meta.db_table} ({", ".join(COPY_COLUMNS)}) '
+            'FROM STDIN WITH (FORMAT csv, FORCE_NOT_NULL (patient_notes))'
+        )
+        with transaction.atomic(), connection.cursor() as cursor:
+            with cursor.copy(sql) as copy:
+                copy.write(buffer.getvalue())
+
+    @staticmethod
+    def _bulk_rows(rows):
+        # created_at заполняется auto_now_add, поэтому при bulk_create все даты — текущие
+        objs = [
+            NIHSSCalculation(
+                id=calc_id,
+                user_id=user_id,
+                patient_age=age,
+                total_score=total,
+                severity=severity,
+                interpretation=interpretation,
+                **dict(zip(NIHSSCalculator.SCORE_ITEMS, values)),
+            )
+            for calc_id, user_id, age, (values, total, severity, interpretation), _ in rows
+        ]
+        NIHSSCalculation.objects.bulk_create(objs, batch_size=5000)
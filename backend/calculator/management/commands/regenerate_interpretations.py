@@ -0,0 +1,78 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from calculator.gigachat_service import gigachat_service
+from calculator.models import NIHSSCalculation
+from calculator.services import NIHSSCalculator
+
+
+class Command(BaseCommand):
+    help = 'Перегенерирует заключения оценок NIHSS пакетными запросами к GigaChat'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=5, help='Оценок в одном запросе к GigaChat')
+        parser.add_argument('--chunk-size', type=int, default=100, help='Оценок, сохраняемых за раз')
+        parser.add_argument('--user', help='Только оценки пользователя с этим email')
+        parser.add_argument('--limit', type=int, help='Максимальное число оценок')
+
+    def handle(self, *args, **options):
+        if gigachat_service.status() == 'disabled':
+            raise CommandError('GIGACHAT_CREDENTIALS не заданы: заключения не будут перегенерированы')
+
+        queryset = NIHSSCalculation.objects.order_by('created_at').only(
+            'id', 'patient_age', 'patient_notes', 'total_score', 'severity', *NIHSSCalculator.SCORE_ITEMS,
+        )
+        if options['user']:
+            queryset = queryset.filter(user__email__iexact=options['user'])
+        if options['limit']:
+            queryset = queryset[:options['limit']]
+
+        started = time.monotonic()
+        done = skipped = 0
+        chunk = []
+        for calculation in queryset.iterator(chunk_size=options['chunk_size']):
+            chunk.append(calculation)
+            if len(chunk) == options['chunk_size']:
+                done, skipped = self._process(chunk, options['batch_size'], done, skipped, started)
+                chunk = []
+        if chunk:
+            done, skipped = self._process(chunk, options['batch_size'], done, skipped, started)
+
+        self.stdout.write(self.style.SUCCESS(f'Обновлено заключений: {done}, пропущено: {skipped}'))
+
+    def _process(self, chunk, batch_size, done, skipped, started):
+        updated = self._regenerate(chunk, batch_size)
+        done += updated
+        skipped += len(chunk) - updated
+        self._report(done, skipped, started)
+        if not updated:
+            # GigaChat не ответил ни на одну оценку (ошибки или открытый circuit breaker)
+            raise CommandError(f'GigaChat недоступен, остановлено. Обновлено: {done}, пропущено: {skipped}')
+        return done, skipped
+
+    @staticmethod
+    def _regenerate(calculations, batch_size):
+        """Сохраняет только заключения GigaChat; статические не перезаписывают имеющиеся"""
+        assessments = [
+            {
+                'scores': calculation.get_scores(),
+                'total_score': calculation.total_score,
+                'severity': calculation.severity,
+                'patient_age': calculation.patient_age,
+                'patient_notes': calculation.patient_notes,
+            }
+            for calculation in calculations
+        ]
+        results = gigachat_service.generate_interpretations(assessments, batch_size=batch_size)
+        updated = []
+        for calculation, (interpretation, is_fallback) in zip(calculations, results):
+            if not is_fallback:
+                calculation.interpretation = interpretation
+                updated.append(calculation)
+        NIHSSCalculation.objects.bulk_update(updated, ['interpretation'])
+        return len(updated)
+
+    def _report(self, done, skipped, started):
+        elapsed = time.monotonic() - started
+        self.stdout.write(f'{done} оценок, пропущено {skipped}, {done / elapsed:.1f} оценок/с')
@@ -0,0 +1,58 @@
+import uuid
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('calculator', '0002_idempotency_key'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Patient',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('label', models.CharField(max_length=150)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('user', models.ForeignKey(
+                    on_delete=django.db.models.deletion.CASCADE,
+                    related_name='patients',
+                    to=settings.AUTH_USER_MODEL,
+                )),
+            ],
+            options={
+                'verbose_name': 'Пациент',
+                'verbose_name_plural': 'Пациенты',
+                'db_table': 'patients',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.AddField(
+            model_name='nihsscalculation',
+            name='patient',
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name='calculations',
+                to='calculator.patient',
+            ),
+        ),
+        migrations.AddField(
+            model_name='nihsscalculation',
+            name='total_delta',
+            field=models.SmallIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='nihsscalculation',
+            name='score_deltas',
+            field=models.JSONField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='nihsscalculation',
+            index=models.Index(fields=['patient', 'created_at'], name='idx_nihss_patient_created'),
+        ),
+    ]
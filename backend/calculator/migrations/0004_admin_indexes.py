@@ -0,0 +1,20 @@
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('calculator', '0003_patient'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='nihsscalculation',
+            index=models.Index(fields=['created_at'], name='idx_nihss_created'),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(django.db.models.functions.text.Upper('email'), name='idx_users_email_upper'),
+        ),
+    ]
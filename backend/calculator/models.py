@@ -1,15 +1,24 @@
 import uuid
 from django.contrib.auth.models import AbstractBaseUser, BaseUserManager, PermissionsMixin
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
+from django.db.models.functions import Upper
+from django.utils import timezone
+
+from .services import NIHSSCalculator
 
 
 class UserManager(BaseUserManager):
-    def create_user(self, email, full_name, password=None, **extra_fields):
+    def create_user(self, email, full_name, password=None, password_hash=None, **extra_fields):
         if not email:
             raise ValueError('Email обязателен')
         email = self.normalize_email(email)
         user = self.model(email=email, full_name=full_name, **extra_fields)
-        user.set_password(password)
+        # password_hash — уже вычисленный хеш (см. calculator.passwords)
+        if password_hash is not None:
+            user.password = password_hash
+        else:
+            user.set_password(password)
         user.save(using=self._db)
         return user
 
@@ -34,6 +43,10 @@ class User(AbstractBaseUser, PermissionsMixin):
 
     class Meta:
         db_table = 'users'
+        indexes = [
+            # Поиск по email без учёта регистра (email__iexact, поиск в админке)
+            models.Index(Upper('email'), name='idx_users_email_upper'),
+        ]
         verbose_name = 'Пользователь'
         verbose_name_plural = 'Пользователи'
 
@@ -41,6 +54,24 @@ class User(AbstractBaseUser, PermissionsMixin):
         return self.email
 
 
+class Patient(models.Model):
+    """Пациент, у которого оценка NIHSS проводится повторно (поступление, 24 ч, выписка)"""
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='patients')
+    label = models.CharField(max_length=150)  # Номер истории болезни или инициалы
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'patients'
+        ordering = ['-created_at']
+        verbose_name = 'Пациент'
+        verbose_name_plural = 'Пациенты'
+
+    def __str__(self):
+        return self.label
+
+
 class NIHSSCalculation(models.Model):
     """Запись оценки по шкале NIHSS"""
 
@@ -54,6 +85,9 @@ class NIHSSCalculation(models.Model):
 
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='calculations')
+    patient = models.ForeignKey(
+        Patient, on_delete=models.SET_NULL, null=True, blank=True, related_name='calculations',
+    )
 
     # Параметры пациента
     patient_age = models.PositiveIntegerField()
@@ -92,13 +126,61 @@ class NIHSSCalculation(models.Model):
     severity = models.CharField(max_length=20, choices=SEVERITY_CHOICES)
     interpretation = models.TextField(blank=True, default='')
 
+    # Динамика относительно предыдущей оценки того же пациента (вычисляется при вставке)
+    total_delta = models.SmallIntegerField(null=True, blank=True)
+    score_deltas = models.JSONField(null=True, blank=True)
+
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
         db_table = 'nihss_calculations'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['patient', 'created_at'], name='idx_nihss_patient_created'),
+            models.Index(fields=['created_at'], name='idx_nihss_created'),
+        ]
         verbose_name = 'Оценка NIHSS'
         verbose_name_plural = 'Оценки NIHSS'
 
     def __str__(self):
         return f'{self.user.email} — {self.total_score} баллов ({self.get_severity_display()})'
+
+    def get_scores(self) -> dict:
+        return {item: getattr(self, item) for item in NIHSSCalculator.SCORE_ITEMS}
+
+    def set_deltas(self, previous):
+        """Заполняет динамику по предыдущей оценке пациента; None — первая оценка"""
+        if previous is None:
+            self.total_delta = None
+            self.score_deltas = None
+            return
+        self.total_delta = self.total_score - previous.total_score
+        self.score_deltas = NIHSSCalculator.score_deltas(self.get_scores(), previous.get_scores())
+
+
+class IdempotencyKey(models.Model):
+    """Сохранённый ответ на POST /calculations для повторов с тем же Idempotency-Key"""
+
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='idempotency_keys')
+    key = models.CharField(max_length=255)
+    response_status = models.PositiveSmallIntegerField(null=True, blank=True)
+    response_body = models.JSONField(null=True, blank=True, encoder=DjangoJSONEncoder)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    # Начало текущей обработки; незавершённую заявку старше IDEMPOTENCY_LEASE_SECONDS
+    # (воркер упал или был перезапущен) может перехватить повторный запрос
+    started_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        db_table = 'idempotency_keys'
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'key'], name='uniq_idempotency_user_key'),
+        ]
+        verbose_name = 'Ключ идемпотентности'
+        verbose_name_plural = 'Ключи идемпотентности'
+
+    def __str__(self):
+        return f'{self.user_id} — {self.key}'
+
+    @property
+    def is_completed(self):
+        return self.response_status is not None
@@ -0,0 +1,108 @@
+"""
+Хеширование паролей в отдельном пуле процессов.
+
+Argon2 занимает десятки миллисекунд CPU и ~100 МБ памяти на вызов. Вход и регистрация
+передают эту работу в ограниченный пул (PASSWORD_HASH_WORKERS процессов на воркер
+gunicorn), чтобы всплеск логинов не занимал потоки, обслуживающие расчёты. Если в
+очереди уже PASSWORD_HASH_QUEUE_LIMIT задач, запрос сразу отклоняется (HashingOverloaded).
+Место в очереди освобождается, когда задача действительно завершилась, а не когда
+истёк PASSWORD_HASH_TIMEOUT. Упавший пул (процесс убит OOM) пересоздаётся.
+При PASSWORD_HASH_WORKERS=0 хеширование выполняется в текущем потоке.
+"""
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor, TimeoutError
+from concurrent.futures.process import BrokenProcessPool
+
+from django.conf import settings
+from django.contrib.auth import hashers
+
+_executor = None
+_slots = None
+_lock = threading.Lock()
+
+
+class HashingOverloaded(Exception):
+    """Очередь хеширования заполнена, задача не успела выполниться или пул упал"""
+
+
+def _init_worker():
+    import django
+    django.setup()
+
+
+def _verify(password, encoded):
+    return hashers.verify_password(password, encoded)
+
+
+def _make(password):
+    return hashers.make_password(password)
+
+
+def _get_executor():
+    global _executor, _slots
+    if settings.PASSWORD_HASH_WORKERS <= 0:
+        return None
+    with _lock:
+        if _executor is None:
+            # spawn, а не fork: воркер gunicorn многопоточный
+            _executor = ProcessPoolExecutor(
+                max_workers=settings.PASSWORD_HASH_WORKERS,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_init_worker,
+            )
+        if _slots is None:
+            _slots = threading.BoundedSemaphore(settings.PASSWORD_HASH_QUEUE_LIMIT)
+    return _executor
+
+
+def _discard_executor(executor):
+    """Убирает сломанный пул; следующий вызов _get_executor() создаст новый"""
+    global _executor
+    with _lock:
+        if _executor is executor:
+            _executor = None
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _run(func, *args):
+    executor = _get_executor()
+    if executor is None:
+        return func(*args)
+    slots = _slots
+    if not slots.acquire(blocking=False):
+        raise HashingOverloaded
+    try:
+        future = executor.submit(func, *args)
+    except (BrokenProcessPool, RuntimeError):
+        # RuntimeError: пул уже закрыт другим потоком после поломки
+        slots.release()
+        _discard_executor(executor)
+        raise HashingOverloaded
+    future.add_done_callback(lambda _: slots.release())
+    try:
+        return future.result(timeout=settings.PASSWORD_HASH_TIMEOUT)
+    except TimeoutError:
+        raise HashingOverloaded
+    except BrokenProcessPool:
+        _discard_executor(executor)
+        raise HashingOverloaded
+
+
+def make_password(password):
+    return _run(_make, password)
+
+
+def check_password(user, password):
+    """
+    Аналог user.check_password(): при устаревших параметрах хеша (или другом
+    алгоритме) пароль перехешируется с текущими настройками и сохраняется.
+    """
+    is_correct, must_update = _run(_verify, password, user.password)
+    if is_correct and must_update:
+        try:
+            user.password = _run(_make, password)
+        except HashingOverloaded:
+            return is_correct  # перехеширование подождёт до следующего входа
+        user.save(update_fields=['password'])
+    return is_correct
@@ -0,0 +1,52 @@
+import datetime
+import decimal
+import uuid
+
+import msgpack
+from django.utils.functional import Promise
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+from rest_framework.renderers import BaseRenderer
+from rest_framework.settings import api_settings
+
+
+def _encode_default(obj):
+    """Типы, которые msgpack не сериализует сам; формат совпадает с JSON-ответами DRF"""
+    if isinstance(obj, datetime.datetime):
+        value = obj.isoformat()
+        return value[:-6] + 'Z' if value.endswith('+00:00') else value
+    if isinstance(obj, (datetime.date, datetime.time)):
+        return obj.isoformat()
+    if isinstance(obj, (uuid.UUID, decimal.Decimal)):
+        return str(obj)
+    if isinstance(obj, Promise):  # ленивые строки gettext
+        return str(obj)
+    raise TypeError(f'Cannot serialize {type(obj).__name__} to MessagePack')
+
+
+class MessagePackRenderer(BaseRenderer):
+    """Компактный бинарный формат для мобильного клиента (Accept: application/msgpack)"""
+    media_type = 'application/msgpack'
+    format = 'msgpack'
+    charset = None
+    render_style = 'binary'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return msgpack.packb(data, default=_encode_default, use_bin_type=True)
+
+
+class MessagePackParser(BaseParser):
+    media_type = 'application/msgpack'
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return msgpack.unpackb(stream.read(), raw=False)
+        except Exception as e:
+            raise ParseError(f'MessagePack parse error - {e}')
+
+
+# Классы для эндпоинтов расчётов: JSON остаётся форматом по умолчанию
+RENDERER_CLASSES = [*api_settings.DEFAULT_RENDERER_CLASSES, MessagePackRenderer]
+PARSER_CLASSES = [*api_settings.DEFAULT_PARSER_CLASSES, MessagePackParser]
@@ -1,7 +1,9 @@
 from rest_framework import serializers
 from django.contrib.auth.password_validation import validate_password
-from .models import User, NIHSSCalculation
-from .services import NIHSSCalculator
+from django.db import transaction
+from . import passwords
+from .models import User, Patient, NIHSSCalculation
+from .services import NIHSSCalculator, ScoreOutOfRange
 from .gigachat_service import gigachat_service
 
 
@@ -18,7 +20,8 @@ class RegisterSerializer(serializers.ModelSerializer):
         return value.lower()
 
     def create(self, validated_data):
-        return User.objects.create_user(**validated_data)
+        password = validated_data.pop('password')
+        return User.objects.create_user(password_hash=passwords.make_password(password), **validated_data)
 
 
 class UserSerializer(serializers.ModelSerializer):
@@ -28,11 +31,18 @@ class UserSerializer(serializers.ModelSerializer):
         read_only_fields = fields
 
 
+class PatientSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Patient
+        fields = ('id', 'label', 'created_at')
+        read_only_fields = ('id', 'created_at')
+
+
 class NIHSSCalculationCreateSerializer(serializers.ModelSerializer):
     class Meta:
         model = NIHSSCalculation
         fields = (
-            'patient_age', 'patient_notes',
+            'patient', 'patient_age', 'patient_notes',
             'loc', 'loc_questions', 'loc_commands',
             'best_gaze', 'visual', 'facial_palsy',
             'motor_arm_left', 'motor_arm_right',
@@ -41,53 +51,85 @@ class NIHSSCalculationCreateSerializer(serializers.ModelSerializer):
             'best_language', 'dysarthria', 'extinction',
         )
 
+    def get_fields(self):
+        fields = super().get_fields()
+        # Поиск только среди своих пациентов: чужой и несуществующий UUID неотличимы
+        patient = fields['patient']
+        patient.queryset = Patient.objects.filter(user=self.context['request'].user)
+        patient.error_messages['does_not_exist'] = 'Пациент не найден.'
+        return fields
+
     def validate_patient_age(self, value):
         if not (0 < value <= 130):
             raise serializers.ValidationError('Возраст должен быть от 1 до 130 лет.')
         return value
 
-    def _validate_score(self, value, field_name, max_score):
-        if not (0 <= value <= max_score):
+    def validate(self, data):
+        # Проверка диапазонов, сумма и тяжесть за один проход; результат
+        # переиспользуется в create() без повторного расчёта
+        try:
+            self._scoring = NIHSSCalculator.evaluate(data)
+        except ScoreOutOfRange as e:
             raise serializers.ValidationError(
-                f'Значение {field_name} должно быть от 0 до {max_score}.'
+                f'Значение {e.item} должно быть от 0 до {e.max_score}.'
             )
-        return value
-
-    def validate(self, data):
-        for item, max_v in NIHSSCalculator.MAX_SCORES.items():
-            if item in data:
-                self._validate_score(data[item], item, max_v)
         return data
 
-    def create(self, validated_data):
-        user = self.context['request'].user
-        scores = {k: validated_data.get(k, 0) for k in NIHSSCalculator.SCORE_ITEMS}
-        total, severity, _ = NIHSSCalculator.calculate(scores)
-
-        interpretation = gigachat_service.generate_interpretation(
-            scores=scores,
+    def generate_interpretation(self):
+        """
+        Заключение по проверенным данным. Запрос к GigaChat длится до GIGACHAT_TIMEOUT
+        секунд, поэтому вызывается до транзакции, а результат передаётся в save().
+        """
+        values, total, severity = self._scoring
+        interpretation = gigachat_service.request_interpretation(
+            scores=dict(zip(NIHSSCalculator.SCORE_ITEMS, values)),
             total_score=total,
             severity=severity,
-            patient_age=validated_data.get('patient_age', 0),
-            patient_notes=validated_data.get('patient_notes', ''),
+            patient_age=self.validated_data.get('patient_age', 0),
+            patient_notes=self.validated_data.get('patient_notes', ''),
         )
+        if interpretation is None:
+            # Без GigaChat — заключение по правилам из уже проверенного кортежа баллов
+            interpretation = NIHSSCalculator.interpret(values, total, severity)
+        return interpretation
+
+    def create(self, validated_data):
+        user = self.context['request'].user
+        _, total, severity = self._scoring
+        interpretation = validated_data.pop('interpretation', None)
+        if interpretation is None:
+            interpretation = self.generate_interpretation()
 
-        return NIHSSCalculation.objects.create(
+        calculation = NIHSSCalculation(
             user=user,
             total_score=total,
             severity=severity,
             interpretation=interpretation,
             **validated_data,
         )
+        patient = validated_data.get('patient')
+        if patient is None:
+            calculation.save()
+            return calculation
+
+        # Блокировка пациента сериализует параллельные оценки, чтобы динамика
+        # считалась от действительно предыдущей записи
+        with transaction.atomic():
+            Patient.objects.select_for_update().get(pk=patient.pk)
+            previous = patient.calculations.order_by('-created_at').first()
+            calculation.set_deltas(previous)
+            calculation.save()
+        return calculation
 
 
 class NIHSSCalculationSerializer(serializers.ModelSerializer):
     severity_display = serializers.CharField(source='get_severity_display', read_only=True)
+    patient = serializers.PrimaryKeyRelatedField(read_only=True, pk_field=serializers.UUIDField(format='hex_verbose'))
 
     class Meta:
         model = NIHSSCalculation
         fields = (
-            'id', 'patient_age', 'patient_notes',
+            'id', 'patient', 'patient_age', 'patient_notes',
             'loc', 'loc_questions', 'loc_commands',
             'best_gaze', 'visual', 'facial_palsy',
             'motor_arm_left', 'motor_arm_right',
@@ -95,6 +137,10 @@ class NIHSSCalculationSerializer(serializers.ModelSerializer):
             'limb_ataxia', 'sensory',
             'best_language', 'dysarthria', 'extinction',
             'total_score', 'severity', 'severity_display',
+            'total_delta', 'score_deltas',
             'interpretation', 'created_at',
         )
-        read_only_fields = ('id', 'total_score', 'severity', 'severity_display', 'interpretation', 'created_at')
+        read_only_fields = (
+            'id', 'patient', 'total_score', 'severity', 'severity_display',
+            'total_delta', 'score_deltas', 'interpretation', 'created_at',
+        )
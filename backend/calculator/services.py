@@ -61,6 +61,50 @@ class NIHSSCalculator:
         'severe': 'Тяжёлый инсульт',
     }
 
+    LOC_LEVELS = {1: 'нарушено (сомнолентность)', 2: 'значительно нарушено (сопор)', 3: 'кома/ареактивность'}
+    LANGUAGE_LEVELS = {1: 'лёгкая или умеренная афазия', 2: 'тяжёлая афазия', 3: 'мутизм/глобальная афазия'}
+    VISUAL_LEVELS = {1: 'частичная гемианопия', 2: 'полная гемианопия', 3: 'двусторонняя слепота'}
+
+    RECOMMENDATIONS = {
+        'no_stroke': 'Признаки острого инсульта отсутствуют. Рекомендуется динамическое наблюдение.',
+        'minor': (
+            'Малый инсульт или ТИА. Рекомендовано срочное обследование (МРТ/КТ), '
+            'госпитализация, антиагрегантная терапия, контроль сосудистых рисков.'
+        ),
+        'moderate': (
+            'Умеренный инсульт. Экстренная госпитализация в инсультный центр. '
+            'Оценка возможности тромболизиса (rt-PA) в течение 4,5 ч, '
+            'механической тромбэктомии при окклюзии крупных сосудов.'
+        ),
+        'moderate_severe': (
+            'Умеренно тяжёлый инсульт. Срочная госпитализация в нейрореанимацию. '
+            'Мониторинг витальных функций, нейровизуализация, рассмотрение '
+            'реперфузионной терапии, нейропротекция.'
+        ),
+        'severe': (
+            'Тяжёлый инсульт. Немедленная госпитализация в нейрореанимацию. '
+            'ИВЛ при необходимости, интенсивный мониторинг, многопрофильная бригада, '
+            'рассмотрение хирургического вмешательства (декомпрессивная краниоэктомия).'
+        ),
+    }
+
+    @staticmethod
+    def evaluate(scores: dict) -> tuple:
+        """
+        Однопроходная проверка и расчёт для уже приведённых к int значений.
+        Возвращает (values, total_score, severity), где values — кортеж баллов
+        в порядке SCORE_ITEMS. Первый пункт вне диапазона вызывает ScoreOutOfRange.
+        """
+        values = []
+        total = 0
+        for item, max_v in _ITEM_LIMITS:
+            value = scores.get(item, 0)
+            if not 0 <= value <= max_v:
+                raise ScoreOutOfRange(item, max_v)
+            values.append(value)
+            total += value
+        return tuple(values), total, _SEVERITY_BY_TOTAL[total]
+
     @staticmethod
     def calculate(scores: dict) -> tuple:
         """
@@ -73,10 +117,23 @@ class NIHSSCalculator:
             max_v = NIHSSCalculator.MAX_SCORES[item]
             total += max(0, min(value, max_v))
 
-        severity = NIHSSCalculator._classify(total)
+        severity = _SEVERITY_BY_TOTAL[total]
         interpretation = NIHSSCalculator._generate_interpretation(total, severity, scores)
         return total, severity, interpretation
 
+    @staticmethod
+    def score_deltas(scores: dict, previous: dict) -> dict:
+        """
+        Изменение каждого пункта относительно предыдущей оценки.
+        Возвращает только изменившиеся пункты: {item_name: delta}.
+        """
+        deltas = {}
+        for item in NIHSSCalculator.SCORE_ITEMS:
+            diff = int(scores.get(item, 0)) - int(previous.get(item, 0))
+            if diff:
+                deltas[item] = diff
+        return deltas
+
     @staticmethod
     def _classify(total: int) -> str:
         for low, high, label in NIHSSCalculator.SEVERITY_THRESHOLDS:
@@ -86,56 +143,70 @@ class NIHSSCalculator:
 
     @staticmethod
     def _generate_interpretation(total: int, severity: str, scores: dict) -> str:
+        values = tuple(int(scores.get(item, 0)) for item in NIHSSCalculator.SCORE_ITEMS)
+        return NIHSSCalculator.interpret(values, total, severity)
+
+    @staticmethod
+    def interpret(values: tuple, total: int, severity: str) -> str:
+        """
+        Собирает заключение из предвычисленных фрагментов.
+        values — кортеж баллов в порядке SCORE_ITEMS.
+        """
         label = NIHSSCalculator.SEVERITY_LABELS[severity]
         lines = [f'Суммарный балл NIHSS: {total}/42 — {label}.']
 
         # Анализ ключевых доменов
-        consciousness = int(scores.get('loc', 0))
+        consciousness = values[_LOC]
         if consciousness > 0:
-            levels = {1: 'нарушено (сомнолентность)', 2: 'значительно нарушено (сопор)', 3: 'кома/ареактивность'}
-            lines.append(f'Уровень сознания: {levels.get(consciousness, "нарушено")}.')
+            lines.append(_LOC_LINES.get(consciousness, 'Уровень сознания: нарушено.'))
 
-        language = int(scores.get('best_language', 0))
+        language = values[_LANGUAGE]
         if language > 0:
-            lang_map = {1: 'лёгкая или умеренная афазия', 2: 'тяжёлая афазия', 3: 'мутизм/глобальная афазия'}
-            lines.append(f'Речь: {lang_map.get(language, "нарушена")}.')
-
-        arm_l = int(scores.get('motor_arm_left', 0))
-        arm_r = int(scores.get('motor_arm_right', 0))
-        leg_l = int(scores.get('motor_leg_left', 0))
-        leg_r = int(scores.get('motor_leg_right', 0))
-        motor_total = arm_l + arm_r + leg_l + leg_r
+            lines.append(_LANGUAGE_LINES.get(language, 'Речь: нарушена.'))
+
+        motor_total = values[_ARM_L] + values[_ARM_R] + values[_LEG_L] + values[_LEG_R]
         if motor_total > 0:
             lines.append(f'Двигательный дефицит: суммарно {motor_total}/16 баллов.')
 
-        visual = int(scores.get('visual', 0))
+        visual = values[_VISUAL]
         if visual > 0:
-            vis_map = {1: 'частичная гемианопия', 2: 'полная гемианопия', 3: 'двусторонняя слепота'}
-            lines.append(f'Нарушения зрения: {vis_map.get(visual, "выявлены")}.')
+            lines.append(_VISUAL_LINES.get(visual, 'Нарушения зрения: выявлены.'))
 
         # Рекомендации по тяжести
-        recommendations = {
-            'no_stroke': 'Признаки острого инсульта отсутствуют. Рекомендуется динамическое наблюдение.',
-            'minor': (
-                'Малый инсульт или ТИА. Рекомендовано срочное обследование (МРТ/КТ), '
-                'госпитализация, антиагрегантная терапия, контроль сосудистых рисков.'
-            ),
-            'moderate': (
-                'Умеренный инсульт. Экстренная госпитализация в инсультный центр. '
-                'Оценка возможности тромболизиса (rt-PA) в течение 4,5 ч, '
-                'механической тромбэктомии при окклюзии крупных сосудов.'
-            ),
-            'moderate_severe': (
-                'Умеренно тяжёлый инсульт. Срочная госпитализация в нейрореанимацию. '
-                'Мониторинг витальных функций, нейровизуализация, рассмотрение '
-                'реперфузионной терапии, нейропротекция.'
-            ),
-            'severe': (
-                'Тяжёлый инсульт. Немедленная госпитализация в нейрореанимацию. '
-                'ИВЛ при необходимости, интенсивный мониторинг, многопрофильная бригада, '
-                'рассмотрение хирургического вмешательства (декомпрессивная краниоэктомия).'
-            ),
-        }
-        lines.append(recommendations.get(severity, ''))
+        lines.append(NIHSSCalculator.RECOMMENDATIONS.get(severity, ''))
 
         return ' '.join(lines)
+
+
+class ScoreOutOfRange(ValueError):
+    """Балл пункта шкалы вне допустимого диапазона 0..max_score"""
+
+    def __init__(self, item: str, max_score: int):
+        super().__init__(item, max_score)
+        self.item = item
+        self.max_score = max_score
+
+
+# Предвычисленные таблицы для однопроходной оценки (evaluate/interpret)
+_ITEM_LIMITS = tuple((item, NIHSSCalculator.MAX_SCORES[item]) for item in NIHSSCalculator.SCORE_ITEMS)
+_SEVERITY_BY_TOTAL = tuple(NIHSSCalculator._classify(total) for total in range(43))
+
+_INDEX = {item: i for i, item in enumerate(NIHSSCalculator.SCORE_ITEMS)}
+_LOC = _INDEX['loc']
+_LANGUAGE = _INDEX['best_language']
+_VISUAL = _INDEX['visual']
+_ARM_L, _ARM_R = _INDEX['motor_arm_left'], _INDEX['motor_arm_right']
+_LEG_L, _LEG_R = _INDEX['motor_leg_left'], _INDEX['motor_leg_right']
+
+_LOC_LINES = {
+    level: f'Уровень сознания: {text}.'
+    for level, text in NIHSSCalculator.LOC_LEVELS.items()
+}
+_LANGUAGE_LINES = {
+    level: f'Речь: {text}.'
+    for level, text in NIHSSCalculator.LANGUAGE_LEVELS.items()
+}
+_VISUAL_LINES = {
+    level: f'Нарушения зрения: {text}.'
+    for level, text in NIHSSCalculator.VISUAL_LEVELS.items()
+}
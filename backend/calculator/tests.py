@@ -0,0 +1,78 @@
+from unittest import mock
+
+from django.db import connection, connections
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from .admin import EstimatedCountPaginator
+from .models import NIHSSCalculation, User
+from .services import NIHSSCalculator
+
+
+def create_calculations(users, per_user=3):
+    for i in range(users):
+        user = User.objects.create_user(email=f'doctor{User.objects.count()}@example.com', full_name=f'Врач {i}')
+        for total in range(per_user):
+            NIHSSCalculation.objects.create(
+                user=user,
+                patient_age=60 + total,
+                loc=total,
+                total_score=total,
+                severity=NIHSSCalculator._classify(total),
+                interpretation='',
+            )
+
+
+# Манифест whitenoise появляется только после collectstatic
+@override_settings(STORAGES={
+    'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+    'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+})
+class NIHSSCalculationAdminTests(TestCase):
+    url = reverse('admin:calculator_nihsscalculation_changelist')
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_superuser(email='admin@example.com', full_name='Администратор')
+
+    def setUp(self):
+        self.client.force_login(self.admin)
+
+    def test_changelist_query_count_does_not_grow_with_users(self):
+        # Число запросов зависит от СУБД (на PostgreSQL пагинатор ещё читает
+        # pg_class), поэтому сравнивается с тем же списком для одного автора
+        create_calculations(users=1)
+        with CaptureQueriesContext(connection) as baseline:
+            self.assertEqual(self.client.get(self.url).status_code, 200)
+
+        create_calculations(users=5)
+        with self.assertNumQueries(len(baseline)):
+            response = self.client.get(self.url)
+        self.assertContains(response, 'doctor5@example.com')
+
+
+class EstimatedCountPaginatorTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        create_calculations(users=2)
+
+    def paginate(self, estimate):
+        # Оценка доступна только на PostgreSQL; здесь она подменяется
+        with mock.patch.object(connections['default'], 'vendor', 'postgresql'), \
+                mock.patch.object(EstimatedCountPaginator, '_estimate', return_value=estimate):
+            paginator = EstimatedCountPaginator(NIHSSCalculation.objects.order_by('-created_at'), 20)
+            return paginator.count, paginator.num_pages
+
+    @override_settings(ADMIN_ESTIMATED_COUNT_THRESHOLD=0)
+    def test_uses_estimate_above_threshold(self):
+        with self.assertNumQueries(0):
+            self.assertEqual(self.paginate(estimate=1_000_000), (1_000_000, 50_000))
+
+    @override_settings(ADMIN_ESTIMATED_COUNT_THRESHOLD=100_000)
+    def test_exact_count_below_threshold(self):
+        self.assertEqual(self.paginate(estimate=5), (6, 1))
+
+    @override_settings(ADMIN_ESTIMATED_COUNT_THRESHOLD=0)
+    def test_exact_count_without_statistics(self):
+        self.assertEqual(self.paginate(estimate=None), (6, 1))
@@ -0,0 +1,12 @@
+from rest_framework.throttling import SimpleRateThrottle
+
+
+class LoginAccountThrottle(SimpleRateThrottle):
+    """Ограничение попыток входа на один email независимо от IP"""
+    scope = 'login_account'
+
+    def get_cache_key(self, request, view):
+        email = str(request.data.get('email', '')).strip().lower()
+        if not email:
+            return None
+        return self.cache_format % {'scope': self.scope, 'ident': email}
@@ -10,4 +10,7 @@ urlpatterns = [
     path('calculations', views.CalculationListCreateView.as_view(), name='calculations'),
     path('calculations/<uuid:pk>', views.CalculationDetailView.as_view(), name='calculation-detail'),
     path('calculations/statistics', views.statistics_view, name='statistics'),
+    path('patients', views.PatientListCreateView.as_view(), name='patients'),
+    path('patients/<uuid:pk>', views.PatientDetailView.as_view(), name='patient-detail'),
+    path('patients/<uuid:pk>/timeline', views.PatientTimelineView.as_view(), name='patient-timeline'),
 ]
@@ -1,27 +1,50 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
 from django.db.models import Avg, Count
+from django.utils import timezone
 from rest_framework import generics, status
-from rest_framework.decorators import api_view, permission_classes
+from rest_framework.decorators import api_view, permission_classes, renderer_classes
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
+from rest_framework.throttling import ScopedRateThrottle
 from rest_framework_simplejwt.tokens import RefreshToken
 
-from .models import NIHSSCalculation, User
+from . import passwords
+from .models import IdempotencyKey, NIHSSCalculation, Patient, User
+from .renderers import PARSER_CLASSES, RENDERER_CLASSES
 from .serializers import (
     NIHSSCalculationCreateSerializer,
     NIHSSCalculationSerializer,
+    PatientSerializer,
     RegisterSerializer,
     UserSerializer,
 )
+from .throttles import LoginAccountThrottle
+
+
+def _hashing_busy_response():
+    return Response(
+        {'detail': 'Сервер перегружен, повторите попытку позже.'},
+        status=status.HTTP_503_SERVICE_UNAVAILABLE,
+        headers={'Retry-After': '5'},
+    )
 
 
 class RegisterView(generics.CreateAPIView):
     serializer_class = RegisterSerializer
     permission_classes = [AllowAny]
+    throttle_classes = [ScopedRateThrottle]
+    throttle_scope = 'register'
 
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        user = serializer.save()
+        try:
+            user = serializer.save()
+        except passwords.HashingOverloaded:
+            return _hashing_busy_response()
         refresh = RefreshToken.for_user(user)
         return Response({
             'user': UserSerializer(user).data,
@@ -32,16 +55,21 @@ class RegisterView(generics.CreateAPIView):
 
 class LoginView(generics.GenericAPIView):
     permission_classes = [AllowAny]
+    # Лимиты проверяются до хеширования, поэтому перебор не тратит CPU на Argon2
+    throttle_classes = [ScopedRateThrottle, LoginAccountThrottle]
+    throttle_scope = 'login'
 
     def post(self, request):
         email = request.data.get('email', '').lower()
         password = request.data.get('password', '')
         try:
             user = User.objects.get(email=email)
-            if not user.check_password(password):
+            if not passwords.check_password(user, password):
                 raise User.DoesNotExist
         except User.DoesNotExist:
             return Response({'detail': 'Неверный email или пароль.'}, status=status.HTTP_401_UNAUTHORIZED)
+        except passwords.HashingOverloaded:
+            return _hashing_busy_response()
         refresh = RefreshToken.for_user(user)
         return Response({
             'user': UserSerializer(user).data,
@@ -60,6 +88,8 @@ class MeView(generics.RetrieveAPIView):
 
 class CalculationListCreateView(generics.ListCreateAPIView):
     permission_classes = [IsAuthenticated]
+    renderer_classes = RENDERER_CLASSES
+    parser_classes = PARSER_CLASSES
 
     def get_queryset(self):
         return NIHSSCalculation.objects.filter(user=self.request.user).order_by('-created_at')
@@ -70,22 +100,148 @@ class CalculationListCreateView(generics.ListCreateAPIView):
         return NIHSSCalculationSerializer
 
     def create(self, request, *args, **kwargs):
+        key = request.headers.get('Idempotency-Key', '').strip()
+        if not key:
+            return self._perform_create(request)
+        if len(key) > 255:
+            return Response(
+                {'detail': 'Idempotency-Key не должен превышать 255 символов.'},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        record, replay = self._claim_idempotency_key(request.user, key)
+        if replay is not None:
+            return replay
+
+        # Запись оценки и сохранённый ответ фиксируются вместе: если заявку за это
+        # время перехватил другой запрос, вставка откатывается
+        owned = IdempotencyKey.objects.filter(pk=record.pk, started_at=record.started_at)
+
+        def store_response(response):
+            if not owned.update(response_status=response.status_code, response_body=response.data):
+                raise _ClaimLost
+
+        try:
+            response = self._perform_create(request, on_saved=store_response)
+        except _ClaimLost:
+            return _in_progress_response()
+        except Exception:
+            owned.delete()
+            raise
+        return response
+
+    def _perform_create(self, request, on_saved=None):
         serializer = NIHSSCalculationCreateSerializer(data=request.data, context={'request': request})
         serializer.is_valid(raise_exception=True)
-        calculation = serializer.save()
-        return Response(NIHSSCalculationSerializer(calculation).data, status=status.HTTP_201_CREATED)
+        # GigaChat вызывается вне транзакции, чтобы не держать соединение на время ответа API
+        interpretation = serializer.generate_interpretation()
+        with transaction.atomic():
+            calculation = serializer.save(interpretation=interpretation)
+            response = Response(NIHSSCalculationSerializer(calculation).data, status=status.HTTP_201_CREATED)
+            if on_saved is not None:
+                on_saved(response)
+        return response
+
+    def _claim_idempotency_key(self, user, key):
+        """
+        Резервирует ключ за текущим запросом. Возвращает (record, None), если запрос
+        нужно выполнить, или (None, response) для повтора. Незавершённая заявка
+        старше IDEMPOTENCY_LEASE_SECONDS перехватывается.
+        """
+        now = timezone.now()
+        cutoff = now - timedelta(hours=settings.IDEMPOTENCY_KEY_TTL_HOURS)
+        IdempotencyKey.objects.filter(user=user, key=key, created_at__lt=cutoff).delete()
+        try:
+            with transaction.atomic():
+                return IdempotencyKey.objects.create(user=user, key=key, started_at=now), None
+        except IntegrityError:
+            existing = IdempotencyKey.objects.filter(user=user, key=key).first()
+
+        if existing is None:
+            return None, _in_progress_response()
+        if existing.is_completed:
+            return None, Response(existing.response_body, status=existing.response_status)
+
+        lease_cutoff = now - timedelta(seconds=settings.IDEMPOTENCY_LEASE_SECONDS)
+        if existing.started_at < lease_cutoff:
+            taken = IdempotencyKey.objects.filter(
+                pk=existing.pk, response_status__isnull=True, started_at=existing.started_at,
+            ).update(started_at=now)
+            if taken:
+                existing.started_at = now
+                return existing, None
+        return None, _in_progress_response()
+
+
+class _ClaimLost(Exception):
+    """Заявку на Idempotency-Key перехватил другой запрос"""
+
+
+def _in_progress_response():
+    return Response(
+        {'detail': 'Запрос с этим Idempotency-Key уже обрабатывается.'},
+        status=status.HTTP_409_CONFLICT,
+    )
 
 
 class CalculationDetailView(generics.RetrieveDestroyAPIView):
     serializer_class = NIHSSCalculationSerializer
     permission_classes = [IsAuthenticated]
+    renderer_classes = RENDERER_CLASSES
 
     def get_queryset(self):
         return NIHSSCalculation.objects.filter(user=self.request.user)
 
+    def perform_destroy(self, instance):
+        if instance.patient_id is None:
+            instance.delete()
+            return
+
+        # Следующая оценка пациента теперь сравнивается с предшествующей удалённой
+        with transaction.atomic():
+            Patient.objects.select_for_update().get(pk=instance.patient_id)
+            timeline = NIHSSCalculation.objects.filter(patient_id=instance.patient_id)
+            following = timeline.filter(created_at__gt=instance.created_at).order_by('created_at').first()
+            instance.delete()
+            if following is not None:
+                previous = timeline.filter(created_at__lt=following.created_at).order_by('-created_at').first()
+                following.set_deltas(previous)
+                following.save(update_fields=['total_delta', 'score_deltas'])
+
+
+class PatientListCreateView(generics.ListCreateAPIView):
+    serializer_class = PatientSerializer
+    permission_classes = [IsAuthenticated]
+
+    def get_queryset(self):
+        return Patient.objects.filter(user=self.request.user).order_by('-created_at')
+
+    def perform_create(self, serializer):
+        serializer.save(user=self.request.user)
+
+
+class PatientDetailView(generics.RetrieveUpdateDestroyAPIView):
+    serializer_class = PatientSerializer
+    permission_classes = [IsAuthenticated]
+
+    def get_queryset(self):
+        return Patient.objects.filter(user=self.request.user)
+
+
+class PatientTimelineView(generics.ListAPIView):
+    """Серийные оценки пациента в хронологическом порядке с сохранённой динамикой"""
+    serializer_class = NIHSSCalculationSerializer
+    permission_classes = [IsAuthenticated]
+    renderer_classes = RENDERER_CLASSES
+
+    def get_queryset(self):
+        patient = generics.get_object_or_404(Patient, pk=self.kwargs['pk'], user=self.request.user)
+        return NIHSSCalculation.objects.filter(patient=patient).order_by('created_at')
+
 
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
+@renderer_classes(RENDERER_CLASSES)
 def statistics_view(request):
     qs = NIHSSCalculation.objects.filter(user=request.user)
     total_count = qs.count()
@@ -0,0 +1,54 @@
+"""
+Конфигурация gunicorn для продакшена.
+Запуск: gunicorn -c gunicorn.conf.py nihss.wsgi:application
+
+Все параметры переопределяются переменными окружения (или .env через decouple).
+"""
+import multiprocessing
+
+from decouple import config as env  # имя config зарезервировано настройкой gunicorn
+
+bind = f"0.0.0.0:{env('PORT', default='8000')}"
+
+# gthread: долгий запрос к GigaChat занимает поток, а не весь процесс
+worker_class = 'gthread'
+workers = env('GUNICORN_WORKERS', default=min(multiprocessing.cpu_count() * 2 + 1, 4), cast=int)
+threads = env('GUNICORN_THREADS', default=4, cast=int)
+
+# Приложение импортируется один раз в мастере, воркеры делят память (copy-on-write)
+# и стартуют без повторной инициализации Django
+preload_app = env('GUNICORN_PRELOAD', default=True, cast=bool)
+
+# Перезапуск воркеров против утечек памяти; jitter разносит перезапуски во времени
+max_requests = env('GUNICORN_MAX_REQUESTS', default=1000, cast=int)
+max_requests_jitter = env('GUNICORN_MAX_REQUESTS_JITTER', default=100, cast=int)
+
+timeout = env('GUNICORN_TIMEOUT', default=60, cast=int)
+graceful_timeout = env('GUNICORN_GRACEFUL_TIMEOUT', default=30, cast=int)
+keepalive = env('GUNICORN_KEEPALIVE', default=5, cast=int)
+
+accesslog = '-'
+errorlog = '-'
+loglevel = env('GUNICORN_LOG_LEVEL', default='info')
+
+
+def when_ready(server):
+    """Прогрев в мастере до fork: URLconf, view и сериализаторы загружаются один раз"""
+    if not preload_app:
+        return
+    from importlib import import_module
+
+    from django.conf import settings
+    from django.db import connections
+
+    import_module(settings.ROOT_URLCONF)
+    # Соединения с БД не должны наследоваться воркерами
+    connections.close_all()
+
+
+def post_fork(server, worker):
+    if not preload_app:
+        return
+    from django.db import connections
+
+    connections.close_all()
@@ -2,6 +2,7 @@ from pathlib import Path
 from decouple import config
 from datetime import timedelta
 import dj_database_url
+from corsheaders.defaults import default_headers
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -10,6 +11,9 @@ DEBUG = config('DEBUG', default=True, cast=bool)
 ALLOWED_HOSTS = config('ALLOWED_HOSTS', default='*').split(',')
 
 GIGACHAT_CREDENTIALS = config('GIGACHAT_CREDENTIALS', default='')
+GIGACHAT_TIMEOUT = config('GIGACHAT_TIMEOUT', default=30, cast=float)
+GIGACHAT_BREAKER_THRESHOLD = config('GIGACHAT_BREAKER_THRESHOLD', default=3, cast=int)
+GIGACHAT_BREAKER_COOLDOWN = config('GIGACHAT_BREAKER_COOLDOWN', default=60, cast=float)
 
 INSTALLED_APPS = [
     'django.contrib.admin',
@@ -26,6 +30,7 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'calculator.middleware.APICompressionMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -57,7 +62,7 @@ TEMPLATES = [
 
 DATABASE_URL = config('DATABASE_URL', default='')
 if DATABASE_URL:
-    DATABASES = {'default': dj_database_url.parse(DATABASE_URL, conn_max_age=600)}
+    DATABASES = {'default': dj_database_url.parse(DATABASE_URL)}
 else:
     DATABASES = {
         'default': {
@@ -70,6 +75,42 @@ else:
         }
     }
 
+# Пул соединений одинаков для DATABASE_URL и DB_*:
+# - DB_POOL=True — пул psycopg (psycopg_pool) на процесс, размер DB_POOL_MIN_SIZE..DB_POOL_MAX_SIZE;
+# - иначе постоянные соединения на поток с временем жизни DB_CONN_MAX_AGE секунд.
+# DB_PGBOUNCER=True — режим для PgBouncer с transaction pooling: без серверных курсоров
+# и подготовленных выражений, которые не переживают смену серверного соединения.
+DB_POOL = config('DB_POOL', default=False, cast=bool)
+DB_PGBOUNCER = config('DB_PGBOUNCER', default=False, cast=bool)
+
+_db = DATABASES['default']
+_db['CONN_HEALTH_CHECKS'] = True
+_db.setdefault('OPTIONS', {})
+if _db['ENGINE'] == 'django.db.backends.postgresql':
+    if DB_POOL:
+        _db['CONN_MAX_AGE'] = 0  # Django требует 0 при использовании пула
+        _db['OPTIONS']['pool'] = {
+            'min_size': config('DB_POOL_MIN_SIZE', default=1, cast=int),
+            'max_size': config('DB_POOL_MAX_SIZE', default=10, cast=int),
+            'timeout': config('DB_POOL_TIMEOUT', default=10, cast=float),
+        }
+    else:
+        _db['CONN_MAX_AGE'] = config('DB_CONN_MAX_AGE', default=600, cast=int)
+    if DB_PGBOUNCER:
+        _db['DISABLE_SERVER_SIDE_CURSORS'] = True
+        _db['OPTIONS']['prepare_threshold'] = None
+else:
+    _db['CONN_MAX_AGE'] = config('DB_CONN_MAX_AGE', default=600, cast=int)
+
+# Общий для всех процессов кеш: на нём держатся счётчики throttling входа и регистрации.
+# LocMemCache у каждого воркера gunicorn свой, и лимиты умножались бы на число процессов.
+# По умолчанию — таблица в БД (python manage.py createcachetable), при REDIS_URL — Redis.
+REDIS_URL = config('REDIS_URL', default='')
+if REDIS_URL:
+    CACHES = {'default': {'BACKEND': 'django.core.cache.backends.redis.RedisCache', 'LOCATION': REDIS_URL}}
+else:
+    CACHES = {'default': {'BACKEND': 'django.core.cache.backends.db.DatabaseCache', 'LOCATION': 'django_cache'}}
+
 AUTH_USER_MODEL = 'calculator.User'
 
 AUTH_PASSWORD_VALIDATORS = [
@@ -80,10 +121,20 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 PASSWORD_HASHERS = [
-    'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'calculator.hashers.Argon2PasswordHasher',
     'django.contrib.auth.hashers.PBKDF2PasswordHasher',
 ]
 
+# Параметры Argon2; при изменении пароли перехешируются при следующем входе
+ARGON2_TIME_COST = config('ARGON2_TIME_COST', default=2, cast=int)
+ARGON2_MEMORY_COST = config('ARGON2_MEMORY_COST', default=102400, cast=int)  # КиБ
+ARGON2_PARALLELISM = config('ARGON2_PARALLELISM', default=8, cast=int)
+
+# Пул процессов для хеширования паролей (на каждый воркер gunicorn); 0 — в потоке запроса
+PASSWORD_HASH_WORKERS = config('PASSWORD_HASH_WORKERS', default=1, cast=int)
+PASSWORD_HASH_QUEUE_LIMIT = config('PASSWORD_HASH_QUEUE_LIMIT', default=8, cast=int)
+PASSWORD_HASH_TIMEOUT = config('PASSWORD_HASH_TIMEOUT', default=10, cast=float)
+
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
         'rest_framework_simplejwt.authentication.JWTAuthentication',
@@ -93,6 +144,14 @@ REST_FRAMEWORK = {
     ),
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 20,
+    'DEFAULT_THROTTLE_RATES': {
+        'login': config('THROTTLE_LOGIN_IP', default='20/min'),
+        'login_account': config('THROTTLE_LOGIN_ACCOUNT', default='5/min'),
+        'register': config('THROTTLE_REGISTER', default='10/hour'),
+    },
+    # Число доверенных прокси перед gunicorn: IP клиента для throttling берётся из
+    # X-Forwarded-For на этой глубине. 0 — заголовок игнорируется (прямой доступ)
+    'NUM_PROXIES': config('NUM_PROXIES', default=0, cast=int),
 }
 
 SIMPLE_JWT = {
@@ -103,6 +162,14 @@ SIMPLE_JWT = {
 
 CORS_ALLOW_ALL_ORIGINS = True
 CORS_ALLOW_CREDENTIALS = True
+CORS_ALLOW_HEADERS = (*default_headers, 'idempotency-key')
+
+# Сохранённые ответы для повторов POST /calculations; старые ключи удаляет
+# команда purge_idempotency_keys (запускается по расписанию)
+IDEMPOTENCY_KEY_TTL_HOURS = config('IDEMPOTENCY_KEY_TTL_HOURS', default=24, cast=int)
+# Через сколько секунд незавершённую обработку можно перехватить повтором
+# (должно превышать GUNICORN_TIMEOUT)
+IDEMPOTENCY_LEASE_SECONDS = config('IDEMPOTENCY_LEASE_SECONDS', default=120, cast=int)
 
 LANGUAGE_CODE = 'ru-ru'
 TIME_ZONE = 'Europe/Moscow'
@@ -111,6 +178,15 @@ USE_TZ = True
 
 STATIC_URL = '/static/'
 STATIC_ROOT = BASE_DIR / 'staticfiles'
-STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
+STORAGES = {
+    'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+    'staticfiles': {'BACKEND': 'whitenoise.storage.CompressedManifestStaticFilesStorage'},
+}
+
+# Ответы API меньше этого размера (в байтах) не сжимаются
+RESPONSE_COMPRESSION_MIN_SIZE = config('RESPONSE_COMPRESSION_MIN_SIZE', default=1024, cast=int)
+
+# Выше этого числа строк список в админке использует оценку количества вместо COUNT(*)
+ADMIN_ESTIMATED_COUNT_THRESHOLD = config('ADMIN_ESTIMATED_COUNT_THRESHOLD', default=100000, cast=int)
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
@@ -1,14 +1,35 @@
 from django.contrib import admin
+from django.db import connection
 from django.urls import path, include
 from django.http import JsonResponse
 
+from calculator.gigachat_service import gigachat_service
+
 
 def health(request):
     return JsonResponse({'status': 'ok'})
 
 
+def ready(request):
+    """Готовность принимать трафик: БД обязательна, GigaChat — нет (есть fallback)"""
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT 1')
+        database = 'ok'
+    except Exception:
+        database = 'unavailable'
+
+    ok = database == 'ok'
+    return JsonResponse(
+        {'status': 'ok' if ok else 'unavailable', 'database': database, 'gigachat': gigachat_service.status()},
+        status=200 if ok else 503,
+    )
+
+
 urlpatterns = [
     path('', health),
+    path('healthz', health),
+    path('readyz', ready),
     path('admin/', admin.site.urls),
     path('api/', include('calculator.urls')),
 ]
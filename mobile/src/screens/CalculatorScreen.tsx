@@ -189,6 +189,9 @@ const DEFAULT_SCORES: NIHSSScores = {
   best_language: 0, dysarthria: 0, extinction: 0,
 };
 
+const newIdempotencyKey = () =>
+  `${Date.now().toString(36)}-${Math.random().toString(36).slice(2)}${Math.random().toString(36).slice(2)}`;
+
 export default function CalculatorScreen() {
   const { colors } = useTheme();
   const [patientAge, setPatientAge] = useState('');
@@ -200,6 +203,9 @@ export default function CalculatorScreen() {
 
   const totalLocal = Object.values(scores).reduce((s, v) => s + v, 0);
   const scrollRef = useRef<ScrollView>(null);
+  // Ключ идемпотентности живёт, пока не изменились данные формы: повторное нажатие
+  // после сетевой ошибки не создаст дубль, если первый запрос всё же дошёл до сервера
+  const submissionRef = useRef<{ key: string; payload: string } | null>(null);
 
   const setScore = (key: keyof NIHSSScores, value: number) => {
     setScores((prev) => ({ ...prev, [key]: value }));
@@ -210,13 +216,20 @@ export default function CalculatorScreen() {
       Alert.alert('Ошибка', 'Укажите корректный возраст пациента');
       return;
     }
+    const request = {
+      patient_age: Number(patientAge),
+      patient_notes: patientNotes,
+      ...scores,
+    };
+    const payload = JSON.stringify(request);
+    let submission = submissionRef.current;
+    if (!submission || submission.payload !== payload) {
+      submission = { key: newIdempotencyKey(), payload };
+      submissionRef.current = submission;
+    }
     setLoading(true);
     try {
-      const { data } = await calculatorAPI.calculate({
-        patient_age: Number(patientAge),
-        patient_notes: patientNotes,
-        ...scores,
-      });
+      const { data } = await calculatorAPI.calculate(request, submission.key);
       setResult(data);
       setTimeout(() => scrollRef.current?.scrollToEnd({ animated: true }), 200);
     } catch (e: any) {
@@ -228,6 +241,7 @@ export default function CalculatorScreen() {
 
   const handleReset = () => {
     setScores({ ...DEFAULT_SCORES });
+    submissionRef.current = null;
     setPatientAge('');
     setPatientNotes('');
     setResult(null);
@@ -40,8 +40,12 @@ export const authAPI = {
 };
 
 export const calculatorAPI = {
-  calculate: (data: { patient_age: number; patient_notes: string } & NIHSSScores) =>
-    api.post<NIHSSCalculation>('/calculations', data),
+  calculate: (data: { patient_age: number; patient_notes: string } & NIHSSScores, idempotencyKey?: string) =>
+    api.post<NIHSSCalculation>(
+      '/calculations',
+      data,
+      idempotencyKey ? { headers: { 'Idempotency-Key': idempotencyKey } } : undefined,
+    ),
 
   list: (page = 1) =>
     api.get<{ results: NIHSSCalculation[]; count: number }>(`/calculations?page=${page}`),
@@ -37,13 +37,22 @@ export interface NIHSSScores {
 
 export type SeverityLevel = 'no_stroke' | 'minor' | 'moderate' | 'moderate_severe' | 'severe';
 
+export interface Patient {
+  id: string;
+  label: string;
+  created_at: string;
+}
+
 export interface NIHSSCalculation extends NIHSSScores {
   id: string;
+  patient: string | null;
   patient_age: number;
   patient_notes: string;
   total_score: number;
   severity: SeverityLevel;
   severity_display: string;
+  total_delta: number | null;                              // Изменение к предыдущей оценке пациента
+  score_deltas: Partial<Record<keyof NIHSSScores, number>> | null;
   interpretation: string;
   created_at: string;
 }